@@ -4,6 +4,31 @@ This makes them viewable on GitHub
 """
 import json
 import os
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Line injected after every patched fig.show(); contains no characters that
+# JSON escapes, so it can be counted in the raw notebook text
+IMAGE_EXPORT_LINE = "img_bytes = pio.to_image(fig, format='png', width=1200, height=700)"
+
+# Leading indentation of each line in orjson's 2-space indented output
+INDENT_2 = re.compile(rb'\n((?:  )+)')
+
+
+def dump_notebook(nb):
+    """Serialize a notebook the way nbformat does (indent=1, UTF-8, no ASCII escaping)"""
+    if orjson is None:
+        return json.dumps(nb, ensure_ascii=False, indent=1).encode('utf-8')
+
+    # orjson only offers 2-space indentation; halve it to keep diffs minimal.
+    # JSON strings never contain raw newlines, so every match is indentation.
+    data = orjson.dumps(nb, option=orjson.OPT_INDENT_2)
+    return INDENT_2.sub(lambda m: b'\n' + b' ' * (len(m.group(1)) // 2), data)
+
 
 notebooks = [
     'notebooks/01_data_cleaning.ipynb',
@@ -24,7 +49,16 @@ for notebook_path in notebooks:
 
     # Read the notebook
     with open(notebook_path, 'r', encoding='utf-8') as f:
-        nb = json.load(f)
+        text = f.read()
+
+    # Skip the JSON parse and re-serialization when there is nothing to
+    # patch, or when every fig.show() is already followed by the line this
+    # script injects. Anything else falls through to the per-cell checks.
+    if text.count('fig.show()') <= text.count(IMAGE_EXPORT_LINE):
+        print(f"  No cells modified (already updated or no visualizations)")
+        continue
+
+    nb = json.loads(text)
 
     print(f"  Total cells: {len(nb['cells'])}")
 
@@ -56,7 +90,7 @@ for notebook_path in notebooks:
                     new_lines.append("from IPython.display import Image, display\n")
                     new_lines.append("import plotly.io as pio\n")
                     new_lines.append("try:\n")
-                    new_lines.append("    img_bytes = pio.to_image(fig, format='png', width=1200, height=700)\n")
+                    new_lines.append(f"    {IMAGE_EXPORT_LINE}\n")
                     new_lines.append("    display(Image(img_bytes))\n")
                     new_lines.append("except Exception as e:\n")
                     new_lines.append("    print(f'Static image export requires kaleido: pip install kaleido')\n")
@@ -69,8 +103,8 @@ for notebook_path in notebooks:
 
     if modified_count > 0:
         # Save the modified notebook
-        with open(notebook_path, 'w', encoding='utf-8') as f:
-            json.dump(nb, f, ensure_ascii=False, indent=1)
+        with open(notebook_path, 'wb') as f:
+            f.write(dump_notebook(nb))
 
         print(f"  Modified {modified_count} cells")
         total_modified += modified_count
@@ -0,0 +1,163 @@
+"""
+Per-post flattening helpers for LinkedIn posts
+
+Kept free of pandas and fully annotated so the module can be compiled with
+mypyc (``cd src && mypyc _fastflatten.py``). The compiled extension is picked
+up automatically; without it the module runs as plain Python.
+"""
+
+from functools import lru_cache
+from sys import intern
+from typing import Any, Dict, Final, Optional, Tuple
+
+# Top-level post fields copied into the flattened post as-is
+SIMPLE_FIELDS: Final = (
+    'urn', 'url', 'type', 'text', 'isActivity', 'timeSincePosted', 'shareUrn',
+    'postedAtISO', 'postedAtTimestamp',
+    'numLikes', 'numShares', 'numComments',
+    'canReact', 'canPostComments', 'canShare', 'commentingDisabled', 'rootShare',
+    'authorName', 'authorProfileId', 'authorType', 'authorHeadline',
+    'authorProfileUrl', 'authorProfilePicture', 'authorUrn', 'authorFollowersCount',
+    'activityDescription', 'shareAudience', 'allowedCommentersScope', 'inputUrl',
+)
+
+# Content flag column -> nested post field it is derived from
+CONTENT_FLAGS: Final = {
+    'has_images': 'images',
+    'has_video': 'linkedinVideo',
+    'has_article': 'article',
+    'has_document': 'document',
+    'has_poll': 'poll',
+    'has_event': 'event',
+    'is_reshare': 'resharedPost',
+}
+
+# Count column -> list field whose length it holds
+COUNT_FIELDS: Final = {
+    'num_images': 'images',
+    'num_comments_fetched': 'comments',
+    'num_reactions_fetched': 'reactions',
+    'num_attributes': 'attributes',
+}
+
+# Engagement counts that default to 0 when the post omits them
+ENGAGEMENT_FIELDS: Final = ('numLikes', 'numShares', 'numComments')
+
+# Low-cardinality string fields interned so repeated values share one object
+INTERN_FIELDS: Final = (
+    'type', 'authorType', 'shareAudience', 'allowedCommentersScope',
+    'activityDescription', 'authorHeadline',
+)
+
+# Columns flattened from the nested 'author' dictionary
+AUTHOR_COLUMNS: Final = (
+    'author_firstName', 'author_lastName', 'author_fullName',
+    'author_occupation', 'author_id', 'author_publicId',
+)
+
+# Stand-in for posts without an author dictionary; never mutated
+_EMPTY_AUTHOR: Final[Dict[str, Any]] = {}
+
+
+def extract_author_info(author_dict: Any) -> Dict[str, Any]:
+    """
+    Extract author information from nested author dictionary
+
+    Parameters:
+    -----------
+    author_dict : Optional[Dict[str, Any]]
+        Author information dictionary; anything else is treated as missing
+
+    Returns:
+    --------
+    Dict[str, Any]
+        Flattened author information
+    """
+    return dict(zip(AUTHOR_COLUMNS, author_values(author_dict)))
+
+
+def author_values(author_dict: Any) -> Tuple[Any, ...]:
+    """Author fields in AUTHOR_COLUMNS order (missing values are None)"""
+    # Read from a shared empty dict instead of branching on missing authors
+    author = author_dict if isinstance(author_dict, dict) else _EMPTY_AUTHOR
+
+    first_name = author.get('firstName') or None
+    last_name = author.get('lastName') or None
+
+    return (
+        first_name,
+        last_name,
+        _join_name(first_name, last_name),
+        author.get('occupation'),
+        author.get('id'),
+        author.get('publicId'),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _join_name(first_name: Any, last_name: Any) -> Any:
+    """Full name from optional name parts; cached because authors recur across posts"""
+    if first_name and last_name:
+        return f"{first_name} {last_name}"
+    return first_name or last_name
+
+
+def parse_follower_count(follower_str: Any) -> Optional[int]:
+    """
+    Parse follower count string (e.g., '70,384' -> 70384)
+
+    Parameters:
+    -----------
+    follower_str : Optional[str]
+        Follower count as string with commas
+
+    Returns:
+    --------
+    Optional[int]
+        Parsed follower count or None
+    """
+    if not follower_str or not isinstance(follower_str, str):
+        return None
+
+    try:
+        return int(follower_str.replace(',', ''))
+    except (ValueError, AttributeError):
+        return None
+
+
+def flatten_post_data(post: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten nested post data structure
+
+    Parameters:
+    -----------
+    post : Dict[str, Any]
+        Post dictionary with nested structures
+
+    Returns:
+    --------
+    Dict[str, Any]
+        Flattened post data
+    """
+    # Copy top-level fields by walking the shared schema; follower counts stay
+    # raw here and are parsed for the whole column by the DataFrame builder
+    flat_post = {field: post.get(field) for field in SIMPLE_FIELDS}
+    for field in ENGAGEMENT_FIELDS:
+        if field not in post:
+            flat_post[field] = 0
+    for field in INTERN_FIELDS:
+        value = flat_post[field]
+        if type(value) is str:
+            flat_post[field] = intern(value)
+
+    # Content flags and counts
+    for flag_col, field in CONTENT_FLAGS.items():
+        flat_post[flag_col] = bool(post.get(field))
+    for count_col, field in COUNT_FIELDS.items():
+        value = post.get(field)
+        flat_post[count_col] = len(value) if value else 0
+
+    # Extract detailed author info from nested 'author' field
+    flat_post.update(zip(AUTHOR_COLUMNS, author_values(post.get('author'))))
+
+    return flat_post
@@ -2,15 +2,115 @@
 Data loading utilities for LinkedIn posts analysis
 """
 
+import hashlib
 import json
-import pandas as pd
-from pathlib import Path
-from typing import Dict, List, Any, Optional
 import logging
+import mmap
+import os
+import tempfile
+from itertools import chain
+from multiprocessing import Pool
+from pathlib import Path
+from sys import intern
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Per-post flattening lives in a separate module so it can be compiled with
+# mypyc; import it relative to the package when loaded as src.data_loader,
+# and as a top-level module when src/ is on sys.path (as in the notebooks)
+if __package__:
+    from ._fastflatten import (
+        AUTHOR_COLUMNS,
+        CONTENT_FLAGS,
+        COUNT_FIELDS,
+        ENGAGEMENT_FIELDS,
+        INTERN_FIELDS,
+        SIMPLE_FIELDS,
+        author_values,
+        extract_author_info,
+        flatten_post_data,
+        parse_follower_count,
+    )
+else:
+    from _fastflatten import (
+        AUTHOR_COLUMNS,
+        CONTENT_FLAGS,
+        COUNT_FIELDS,
+        ENGAGEMENT_FIELDS,
+        INTERN_FIELDS,
+        SIMPLE_FIELDS,
+        author_values,
+        extract_author_info,
+        flatten_post_data,
+        parse_follower_count,
+    )
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Post lists at least this long are flattened across worker processes
+PARALLEL_MIN_POSTS = 50_000
+
+# NDJSON files at least this large are parsed across worker processes
+PARALLEL_MIN_NDJSON_BYTES = 64 * 1024 * 1024
+
+# Bump when the prepared DataFrame layout changes to invalidate Parquet caches
+CACHE_VERSION = 1
+
+# Nested post fields read only to derive flags and counts
+NESTED_FIELDS = tuple(dict.fromkeys((*CONTENT_FLAGS.values(), *COUNT_FIELDS.values())))
+
+# Explicit dtypes so pandas does not fall back to int64/object columns
+POST_DTYPES = {
+    'postedAtTimestamp': 'Int64',
+    'numLikes': 'int32',
+    'numShares': 'int32',
+    'numComments': 'int32',
+    'authorFollowersCount': 'Int32',
+    'num_images': 'int16',
+    'num_comments_fetched': 'int32',
+    'num_reactions_fetched': 'int32',
+    'num_attributes': 'int16',
+    **{col: 'boolean' for col in (
+        'isActivity', 'canReact', 'canPostComments', 'canShare',
+        'commentingDisabled', 'rootShare',
+    )},
+    **{col: 'bool' for col in CONTENT_FLAGS},
+    **{col: 'category' for col in (
+        'type', 'authorType', 'shareAudience', 'allowedCommentersScope',
+        'activityDescription',
+    )},
+}
+
+# Column order of the DataFrame returned by posts_to_dataframe; derived
+# columns follow authorFollowersCount
+_DERIVED_AT = SIMPLE_FIELDS.index('authorFollowersCount') + 1
+POST_COLUMNS = (
+    SIMPLE_FIELDS[:_DERIVED_AT]
+    + tuple(CONTENT_FLAGS)
+    + tuple(COUNT_FIELDS)
+    + SIMPLE_FIELDS[_DERIVED_AT:]
+    + AUTHOR_COLUMNS
+)
+
 
 def load_linkedin_json(file_path: str) -> List[Dict[str, Any]]:
     """
@@ -26,172 +126,128 @@ def load_linkedin_json(file_path: str) -> List[Dict[str, Any]]:
     List[Dict[str, Any]]
         List of post dictionaries
     """
-    logger.info(f"Loading data from {file_path}")
+    logger.info("Loading data from %s", file_path)
 
     file_path = Path(file_path)
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    # orjson parses bytes directly in C; fall back to the stdlib decoder
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
 
     if not isinstance(data, list):
         raise ValueError("Expected JSON data to be a list of posts")
 
-    logger.info(f"Loaded {len(data)} posts")
+    logger.info("Loaded %d posts", len(data))
     return data
 
 
-def extract_author_info(author_dict: Optional[Dict]) -> Dict[str, Any]:
+def iter_posts(file_path: str) -> Iterator[Dict[str, Any]]:
     """
-    Extract author information from nested author dictionary
+    Iterate over LinkedIn posts one at a time without loading the whole file
+
+    Files with an .ndjson suffix are read line by line. Otherwise ijson
+    streams the top-level JSON array when it is installed, falling back
+    to load_linkedin_json.
 
     Parameters:
     -----------
-    author_dict : Optional[Dict]
-        Author information dictionary
+    file_path : str
+        Path to the JSON or NDJSON file
 
-    Returns:
-    --------
+    Yields:
+    -------
     Dict[str, Any]
-        Flattened author information
+        Post dictionary
     """
-    if not author_dict or not isinstance(author_dict, dict):
-        return {
-            'author_firstName': None,
-            'author_lastName': None,
-            'author_fullName': None,
-            'author_occupation': None,
-            'author_id': None,
-            'author_publicId': None,
-        }
-
-    first_name = author_dict.get('firstName', '')
-    last_name = author_dict.get('lastName', '')
-    full_name = f"{first_name} {last_name}".strip()
-
-    return {
-        'author_firstName': first_name,
-        'author_lastName': last_name,
-        'author_fullName': full_name,
-        'author_occupation': author_dict.get('occupation'),
-        'author_id': author_dict.get('id'),
-        'author_publicId': author_dict.get('publicId'),
-    }
+    if Path(file_path).suffix != '.ndjson' and ijson is None:
+        yield from load_linkedin_json(file_path)
+        return
 
+    logger.info("Streaming data from %s", file_path)
 
-def parse_follower_count(follower_str: Optional[str]) -> Optional[int]:
-    """
-    Parse follower count string (e.g., '70,384' -> 70384)
+    file_path = Path(file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
 
-    Parameters:
-    -----------
-    follower_str : Optional[str]
-        Follower count as string with commas
+    with open(file_path, 'rb') as f:
+        if file_path.suffix == '.ndjson':
+            for line in f:
+                if line.strip():
+                    yield _json_loads(line)
+            return
 
-    Returns:
-    --------
-    Optional[int]
-        Parsed follower count or None
-    """
-    if not follower_str or not isinstance(follower_str, str):
-        return None
+        # ijson silently yields nothing for a non-array document
+        head = f.read(1024).lstrip()
+        if not head.startswith(b'['):
+            raise ValueError("Expected JSON data to be a list of posts")
+        f.seek(0)
 
-    try:
-        return int(follower_str.replace(',', ''))
-    except (ValueError, AttributeError):
-        return None
+        yield from ijson.items(f, 'item', use_float=True)
 
 
-def flatten_post_data(post: Dict[str, Any]) -> Dict[str, Any]:
+def convert_json_to_ndjson(file_path: str, ndjson_path: Optional[str] = None) -> Path:
     """
-    Flatten nested post data structure
+    Rewrite a LinkedIn posts JSON array as NDJSON (one post per line)
+
+    NDJSON lines can be parsed independently, which lets load_and_prepare_data
+    split large files across worker processes.
 
     Parameters:
     -----------
-    post : Dict[str, Any]
-        Post dictionary with nested structures
+    file_path : str
+        Path to the JSON file
+    ndjson_path : Optional[str]
+        Output path; defaults to file_path with an .ndjson suffix. Must
+        differ from file_path.
 
     Returns:
     --------
-    Dict[str, Any]
-        Flattened post data
+    Path
+        Path of the written NDJSON file
     """
-    # Start with basic fields
-    flat_post = {
-        'urn': post.get('urn'),
-        'url': post.get('url'),
-        'type': post.get('type'),
-        'text': post.get('text'),
-        'isActivity': post.get('isActivity'),
-        'timeSincePosted': post.get('timeSincePosted'),
-        'shareUrn': post.get('shareUrn'),
-        'postedAtISO': post.get('postedAtISO'),
-        'postedAtTimestamp': post.get('postedAtTimestamp'),
-
-        # Engagement metrics
-        'numLikes': post.get('numLikes', 0),
-        'numShares': post.get('numShares', 0),
-        'numComments': post.get('numComments', 0),
-
-        # Boolean flags
-        'canReact': post.get('canReact'),
-        'canPostComments': post.get('canPostComments'),
-        'canShare': post.get('canShare'),
-        'commentingDisabled': post.get('commentingDisabled'),
-        'rootShare': post.get('rootShare'),
-
-        # Author info (simple fields)
-        'authorName': post.get('authorName'),
-        'authorProfileId': post.get('authorProfileId'),
-        'authorType': post.get('authorType'),
-        'authorHeadline': post.get('authorHeadline'),
-        'authorProfileUrl': post.get('authorProfileUrl'),
-        'authorProfilePicture': post.get('authorProfilePicture'),
-        'authorUrn': post.get('authorUrn'),
-        'authorFollowersCount': parse_follower_count(post.get('authorFollowersCount')),
-
-        # Content flags
-        'has_images': bool(post.get('images')),
-        'has_video': bool(post.get('linkedinVideo')),
-        'has_article': bool(post.get('article')),
-        'has_document': bool(post.get('document')),
-        'has_poll': bool(post.get('poll')),
-        'has_event': bool(post.get('event')),
-        'is_reshare': bool(post.get('resharedPost')),
-
-        # Counts
-        'num_images': len(post.get('images', [])),
-        'num_comments_fetched': len(post.get('comments', [])),
-        'num_reactions_fetched': len(post.get('reactions', [])),
-        'num_attributes': len(post.get('attributes', [])),
-
-        # Activity info
-        'activityDescription': post.get('activityDescription'),
-
-        # Audience
-        'shareAudience': post.get('shareAudience'),
-        'allowedCommentersScope': post.get('allowedCommentersScope'),
-
-        # Input URL
-        'inputUrl': post.get('inputUrl'),
-    }
-
-    # Extract detailed author info from nested 'author' field
-    author_info = extract_author_info(post.get('author'))
-    flat_post.update(author_info)
-
-    return flat_post
-
-
-def posts_to_dataframe(posts: List[Dict[str, Any]]) -> pd.DataFrame:
+    if ndjson_path is None:
+        ndjson_path = Path(file_path).with_suffix('.ndjson')
+    ndjson_path = Path(ndjson_path)
+    if ndjson_path.resolve() == Path(file_path).resolve():
+        raise ValueError(f"NDJSON output would overwrite its input: {ndjson_path}")
+
+    # Write to a temporary file so a failed conversion never leaves a
+    # truncated NDJSON file behind
+    tmp_path = ndjson_path.with_name(f"{ndjson_path.name}.{os.getpid()}.tmp")
+    count = 0
+    try:
+        with open(tmp_path, 'wb') as f:
+            for post in iter_posts(file_path):
+                if orjson is not None:
+                    f.write(orjson.dumps(post))
+                else:
+                    f.write(json.dumps(post, ensure_ascii=False).encode('utf-8'))
+                f.write(b'\n')
+                count += 1
+        os.replace(tmp_path, ndjson_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    logger.info("Wrote %d posts to %s", count, ndjson_path)
+    return ndjson_path
+
+
+def posts_to_dataframe(posts: Iterable[Dict[str, Any]]) -> pd.DataFrame:
     """
-    Convert list of posts to pandas DataFrame
+    Convert posts to pandas DataFrame
 
     Parameters:
     -----------
-    posts : List[Dict[str, Any]]
-        List of post dictionaries
+    posts : Iterable[Dict[str, Any]]
+        List or iterator of post dictionaries. Lists with at least
+        PARALLEL_MIN_POSTS posts are flattened in a process pool.
 
     Returns:
     --------
@@ -200,37 +256,357 @@ def posts_to_dataframe(posts: List[Dict[str, Any]]) -> pd.DataFrame:
     """
     logger.info("Converting posts to DataFrame")
 
-    # Flatten all posts
-    flattened_posts = [flatten_post_data(post) for post in posts]
+    processes = _available_cpus()
+    if isinstance(posts, Sequence) and len(posts) >= PARALLEL_MIN_POSTS and processes > 1:
+        df = _flatten_in_pool(posts, processes)
+    else:
+        df = _collect_columns(posts)
+    df = _apply_dtypes(df)
 
-    # Create DataFrame
-    df = pd.DataFrame(flattened_posts)
+    logger.info("Created DataFrame with %d rows and %d columns", len(df), len(df.columns))
 
-    logger.info(f"Created DataFrame with {len(df)} rows and {len(df.columns)} columns")
+    return df
 
+
+def _available_cpus() -> int:
+    """Number of CPUs this process may run on, honouring affinity/container limits"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _collect_columns(posts: Iterable[Dict[str, Any]]) -> pd.DataFrame:
+    """Flatten posts into an untyped DataFrame in a single pass"""
+    # Collect one list per column in a single pass (struct-of-arrays) so
+    # pandas never has to hash keys or infer dtypes row by row
+    columns: Dict[str, List[Any]] = {name: [] for name in SIMPLE_FIELDS}
+    nested: Dict[str, List[Any]] = {field: [] for field in NESTED_FIELDS}
+    authors: List[List[Any]] = [[] for _ in AUTHOR_COLUMNS]
+
+    simple_items = [
+        (name, values) for name, values in columns.items() if name not in INTERN_FIELDS
+    ]
+    interned_items = [(name, columns[name]) for name in INTERN_FIELDS]
+    nested_items = list(nested.items())
+    for post in posts:
+        for name, values in simple_items:
+            values.append(post.get(name))
+        # Share one string object per distinct value as soon as it is read
+        for name, values in interned_items:
+            value = post.get(name)
+            values.append(intern(value) if type(value) is str else value)
+        for field, values in nested_items:
+            values.append(post.get(field))
+        for values, value in zip(authors, author_values(post.get('author'))):
+            values.append(value)
+
+    # Derive flags and counts straight into typed arrays; the nested objects
+    # themselves never become DataFrame columns
+    for flag_col, field in CONTENT_FLAGS.items():
+        values = nested[field]
+        columns[flag_col] = np.fromiter(map(bool, values), dtype=bool, count=len(values))
+    for count_col, field in COUNT_FIELDS.items():
+        values = nested[field]
+        columns[count_col] = np.fromiter(
+            (len(value) if value else 0 for value in values),
+            dtype=POST_DTYPES[count_col],
+            count=len(values),
+        )
+    columns.update(zip(AUTHOR_COLUMNS, authors))
+
+    return pd.DataFrame({name: columns[name] for name in POST_COLUMNS}, copy=False)
+
+
+def _flatten_in_pool(posts: Sequence[Dict[str, Any]], processes: int) -> pd.DataFrame:
+    """Flatten posts with flatten_post_data across worker processes"""
+    # A few chunks per worker balances load while keeping IPC round trips low
+    chunksize = max(1, len(posts) // (processes * 4))
+    logger.info("Flattening %d posts with %d processes", len(posts), processes)
+
+    # from_records consumes the result iterator directly, so no separate
+    # list of flattened posts is built on our side
+    with Pool(processes) as pool:
+        return pd.DataFrame.from_records(
+            pool.imap(flatten_post_data, posts, chunksize=chunksize),
+            columns=list(POST_COLUMNS),
+            nrows=len(posts),
+        )
+
+
+def _apply_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast numeric columns, convert repeated strings to categoricals and parse timestamps"""
+    for col in ENGAGEMENT_FIELDS:
+        df[col] = pd.to_numeric(df[col]).fillna(0)
+    # Follower counts arrive as strings like '70,384'; parse the whole column at once
+    df['authorFollowersCount'] = pd.to_numeric(
+        df['authorFollowersCount'].astype('string').str.replace(',', '', regex=False),
+        errors='coerce',
+    )
+    df = df.astype(POST_DTYPES)
+    df['postedAtISO'] = pd.to_datetime(df['postedAtISO'], utc=True, format='ISO8601', errors='coerce')
     return df
 
 
-def load_and_prepare_data(file_path: str) -> pd.DataFrame:
+def load_and_prepare_data(file_path: str, cache_dir: Optional[str] = '.cache') -> pd.DataFrame:
     """
     Load JSON data and prepare DataFrame
 
+    The prepared DataFrame is cached as Parquet, keyed by the source file's
+    path, size and modification time, so later runs skip JSON parsing.
+
     Parameters:
     -----------
     file_path : str
         Path to the JSON file
+    cache_dir : Optional[str]
+        Directory for the Parquet cache, or None to disable caching
 
     Returns:
     --------
     pd.DataFrame
         Prepared DataFrame
     """
-    posts = load_linkedin_json(file_path)
-    df = posts_to_dataframe(posts)
+    cache_path = _cache_path(file_path, cache_dir) if cache_dir is not None else None
+
+    if cache_path is not None and cache_path.exists():
+        try:
+            # All-null columns come back untyped from Parquet; restore the schema
+            df = pd.read_parquet(cache_path).astype(POST_DTYPES)
+            logger.info("Loaded cached DataFrame from %s", cache_path)
+            return df
+        except Exception as e:
+            logger.warning("Ignoring unreadable cache %s: %s", cache_path, e)
+
+    processes = _available_cpus()
+    path = Path(file_path)
+    if (path.suffix == '.ndjson' and processes > 1
+            and path.stat().st_size >= PARALLEL_MIN_NDJSON_BYTES):
+        df = _ndjson_to_dataframe(path, processes)
+    else:
+        # Flatten posts as they are parsed so the raw JSON tree is never held in memory
+        df = posts_to_dataframe(iter_posts(file_path))
+
+    if cache_path is not None:
+        # Caching is best-effort: a failed write must not lose the loaded data.
+        # Write to a temporary file first so a crash never leaves a truncated cache.
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(tmp_path, compression='zstd')
+            os.replace(tmp_path, cache_path)
+            logger.info("Cached DataFrame to %s", cache_path)
+        except Exception as e:
+            logger.warning("Could not write cache %s: %s", cache_path, e)
+            tmp_path.unlink(missing_ok=True)
+
+    return df
+
+
+def _ndjson_to_dataframe(file_path: Path, processes: int) -> pd.DataFrame:
+    """Parse and flatten byte ranges of an NDJSON file across worker processes"""
+    ranges = _ndjson_ranges(file_path, processes * 4)
+    logger.info("Parsing %s in %d chunks with %d processes", file_path, len(ranges), processes)
+
+    # Workers parse and flatten their own lines, so only the small flattened
+    # rows are pickled back instead of the full post trees
+    with Pool(processes) as pool:
+        chunks = pool.starmap(
+            _flatten_ndjson_range,
+            [(str(file_path), start, end) for start, end in ranges],
+        )
+
+    df = pd.DataFrame.from_records(chain.from_iterable(chunks), columns=list(POST_COLUMNS))
+    df = _apply_dtypes(df)
+
+    logger.info("Created DataFrame with %d rows and %d columns", len(df), len(df.columns))
+
+    return df
+
+
+def _ndjson_ranges(file_path: Path, parts: int) -> List[Tuple[int, int]]:
+    """Split an NDJSON file into roughly equal byte ranges ending on line boundaries"""
+    size = file_path.stat().st_size
+    if size == 0:
+        return []
+
+    bounds = [0]
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for i in range(1, parts):
+            newline = mm.find(b'\n', max(size * i // parts, bounds[-1]))
+            if newline == -1:
+                break
+            bounds.append(newline + 1)
+    bounds.append(size)
+
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def _flatten_ndjson_range(file_path: str, start: int, end: int) -> List[Dict[str, Any]]:
+    """Parse and flatten the NDJSON lines in one byte range"""
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        chunk = f.read(end - start)
+
+    return [flatten_post_data(_json_loads(line)) for line in chunk.splitlines() if line.strip()]
+
+
+def _cache_path(file_path: str, cache_dir: str) -> Path:
+    """Parquet cache location for a source file's current path, size and mtime"""
+    path = Path(file_path).resolve()
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+
+    stat = path.stat()
+    key = f"{CACHE_VERSION}:{stat.st_size}:{int(stat.st_mtime)}:{path}"
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    return Path(cache_dir) / f"{digest}.parquet"
+
+
+def load_and_prepare_data_polars(file_path: str) -> "pl.DataFrame":
+    """
+    Load JSON data and prepare a Polars DataFrame
+
+    Produces the same columns as load_and_prepare_data, with the flattening
+    expressed as a single lazy Polars query. Use ``.to_pandas()`` on the
+    result where pandas is needed.
+
+    Content flags follow the pandas loader's truthiness rules, with one
+    exception: Polars cannot tell an empty nested object from one whose
+    fields are all null, so ``{'field': None}`` counts as absent here.
+
+    Polars also needs every field, nested ones included, to have one
+    consistent type across posts (e.g. ``images`` always a list of
+    objects). Inputs that mix types raise ValueError; load those with
+    load_and_prepare_data, which only reads the nested fields it needs.
+
+    Parameters:
+    -----------
+    file_path : str
+        Path to the JSON file (a top-level array), or to an .ndjson file
+        with one post per line
+
+    Returns:
+    --------
+    pl.DataFrame
+        Prepared DataFrame
+    """
+    if pl is None:
+        raise ImportError("load_and_prepare_data_polars requires polars: pip install polars")
+
+    logger.info("Loading data from %s with polars", file_path)
+
+    file_path = Path(file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    # Polars infers one schema for the whole raw post tree, including nested
+    # fields only read for flags and counts, so a type conflict anywhere in
+    # it fails the load
+    try:
+        if file_path.suffix == '.ndjson':
+            lf = pl.scan_ndjson(file_path, infer_schema_length=None)
+        else:
+            lf = pl.read_json(file_path, infer_schema_length=None).lazy()
+
+        schema = lf.collect_schema()
+        author_dtype = schema.get('author', pl.Null)
+        if author_dtype != pl.Null and not isinstance(author_dtype, pl.Struct):
+            # Authors mixing objects with other values come back as JSON
+            # text, which would silently drop every author column
+            raise pl.exceptions.SchemaError(f"'author' inferred as {author_dtype}, expected objects")
+        df = lf.select(_polars_post_exprs(schema)).collect()
+    except (pl.exceptions.ComputeError, pl.exceptions.SchemaError) as e:
+        raise ValueError(
+            f"Polars could not infer a consistent schema for {file_path}; "
+            f"use load_and_prepare_data instead ({e})"
+        ) from e
+    if not schema:
+        # An empty file selects only literals, which would yield one spurious row
+        df = df.clear()
+
+    logger.info("Created DataFrame with %d rows and %d columns", df.height, df.width)
+
     return df
 
 
+def _polars_post_exprs(schema: "pl.Schema") -> List["pl.Expr"]:
+    """Polars expressions producing POST_COLUMNS from the raw post schema"""
+
+    def field(name: str) -> "pl.Expr":
+        # Fields absent from every post are missing from the inferred schema
+        return pl.col(name) if name in schema else pl.lit(None)
+
+    def has_value(name: str) -> "pl.Expr":
+        dtype = schema.get(name)
+        if dtype is None or dtype == pl.Null:
+            return pl.lit(False)
+        if isinstance(dtype, pl.List):
+            return pl.col(name).list.len().fill_null(0) > 0
+        if isinstance(dtype, pl.Struct):
+            # Missing keys become null struct fields, so an empty object
+            # ({}) has no non-null field, matching bool({}) in pandas
+            if not dtype.fields:
+                return pl.lit(False)
+            return pl.any_horizontal(
+                [pl.col(name).struct.field(f.name).is_not_null() for f in dtype.fields]
+            ).fill_null(False)
+        if dtype == pl.String:
+            return (pl.col(name) != '').fill_null(False)
+        return pl.col(name).is_not_null()
+
+    def list_length(name: str, dtype: "pl.DataType") -> "pl.Expr":
+        if not isinstance(schema.get(name), pl.List):
+            return pl.lit(0, dtype=dtype)
+        return pl.col(name).list.len().fill_null(0).cast(dtype)
+
+    author_dtype = schema.get('author')
+    author_fields = {f.name for f in author_dtype.fields} if isinstance(author_dtype, pl.Struct) else set()
+
+    def author_field(name: str) -> "pl.Expr":
+        if name not in author_fields:
+            return pl.lit(None, dtype=pl.String)
+        return pl.col('author').struct.field(name)
+
+    def non_empty(expr: "pl.Expr") -> "pl.Expr":
+        return pl.when(expr != '').then(expr)
+
+    first_name = non_empty(author_field('firstName'))
+    last_name = non_empty(author_field('lastName'))
+
+    exprs = {name: field(name) for name in SIMPLE_FIELDS}
+    exprs.update({
+        'postedAtISO': field('postedAtISO').cast(pl.String).str.to_datetime(
+            time_zone='UTC', strict=False,
+        ),
+        'authorFollowersCount': field('authorFollowersCount').cast(pl.String)
+        .str.replace_all(',', '', literal=True)
+        .cast(pl.Int32, strict=False),
+        **{name: field(name).fill_null(0).cast(pl.Int32) for name in ENGAGEMENT_FIELDS},
+        **{name: field(name).cast(pl.String).cast(pl.Categorical) for name in (
+            'type', 'authorType', 'shareAudience', 'allowedCommentersScope',
+            'activityDescription',
+        )},
+        **{flag_col: has_value(name) for flag_col, name in CONTENT_FLAGS.items()},
+        **{
+            count_col: list_length(name, pl.Int16 if POST_DTYPES[count_col] == 'int16' else pl.Int32)
+            for count_col, name in COUNT_FIELDS.items()
+        },
+        'author_firstName': first_name,
+        'author_lastName': last_name,
+        'author_fullName': non_empty(
+            pl.concat_str([first_name, last_name], separator=' ', ignore_nulls=True)
+        ),
+        'author_occupation': author_field('occupation'),
+        'author_id': author_field('id'),
+        'author_publicId': author_field('publicId'),
+    })
+
+    return [exprs[name].alias(name) for name in POST_COLUMNS]
+
+
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     # Test the data loader
     file_path = "../dataset_linkedin-post_2025-11-23_06-22-48-536.json"
     df = load_and_prepare_data(file_path)
@@ -238,3 +614,19 @@ if __name__ == "__main__":
     print(f"\nColumns: {list(df.columns)}")
     print(f"\nFirst few rows:\n{df.head()}")
     print(f"\nData types:\n{df.dtypes}")
+
+    # Force the process-pool paths on, even for small inputs and on
+    # single-CPU machines, and check they build the same DataFrame
+    PARALLEL_MIN_POSTS = 0
+    PARALLEL_MIN_NDJSON_BYTES = 0
+    _available_cpus = lambda: 2  # noqa: E731
+
+    posts = load_linkedin_json(file_path)
+    serial_df = posts_to_dataframe(iter(posts))
+    pd.testing.assert_frame_equal(posts_to_dataframe(posts), serial_df)
+    print("\nProcess-pool DataFrame matches the serial build")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        ndjson_path = convert_json_to_ndjson(file_path, Path(tmp_dir) / 'posts.ndjson')
+        pd.testing.assert_frame_equal(load_and_prepare_data(ndjson_path, cache_dir=None), serial_df)
+    print("Parallel NDJSON DataFrame matches the serial build")